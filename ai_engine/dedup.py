@@ -0,0 +1,53 @@
+"""
+Byte-exact chunk deduplication for prompt assembly.
+
+Stage outputs are embedded into later prompts, and they repeat the brief
+(topic, audience, tone) and themselves. Outputs are split into chunks
+(field values, list items, paragraphs) and any chunk whose SHA-256 was
+already sent in the same prompt is dropped before the prompt is rendered.
+"""
+
+import hashlib
+from typing import Any, Iterable, List, Optional, Set
+
+
+def chunk_hash(chunk: str) -> str:
+    """SHA-256 of a chunk, ignoring surrounding whitespace."""
+    return hashlib.sha256(chunk.strip().encode()).hexdigest()
+
+
+def split_chunks(value: Any) -> List[str]:
+    """Split a stage output into chunks: dict field values, list items, or text paragraphs."""
+    if value is None:
+        return []
+    if isinstance(value, dict):
+        return [chunk for v in value.values() for chunk in split_chunks(v)]
+    if isinstance(value, (list, tuple)):
+        return [chunk for v in value for chunk in split_chunks(v)]
+    return [p.strip() for p in str(value).split("\n\n") if p.strip()]
+
+
+def dedupe_chunks(chunks: Iterable[str], seen: Optional[Set[str]] = None) -> List[str]:
+    """
+    Return chunks in order, skipping any whose hash is already in `seen`.
+    `seen` is updated in place so it can be shared across one prompt.
+    """
+    seen = set() if seen is None else seen
+    unique = []
+    for chunk in chunks:
+        digest = chunk_hash(chunk)
+        if digest not in seen:
+            seen.add(digest)
+            unique.append(chunk)
+    return unique
+
+
+def render_unique(value: Any, seen: Optional[Set[str]] = None) -> str:
+    """Render the unique chunks of a stage output as numbered lines, labelled by field for dicts."""
+    fields = value.items() if isinstance(value, dict) else [("", value)]
+    lines = []
+    for field, field_value in fields:
+        label = f"{field}: " if field else ""
+        for chunk in dedupe_chunks(split_chunks(field_value), seen):
+            lines.append(f"[{len(lines) + 1}] {label}{chunk}")
+    return "\n".join(lines)
@@ -0,0 +1,43 @@
+"""
+Structured output schemas for the campaign workflow agents.
+
+These use LangChain's pydantic v1 namespace, which is what
+`with_structured_output` accepts in langchain-core 0.1.x.
+"""
+
+from typing import Dict, List
+
+from langchain_core.pydantic_v1 import BaseModel
+
+
+class ResearchOut(BaseModel):
+    """Research findings for a campaign topic."""
+    themes: List[str]
+    key_points: List[str]
+    keywords: List[str]
+    sources: List[str]
+    summary: str
+
+
+class CopyOut(BaseModel):
+    """Campaign copy."""
+    headline: str
+    body: str
+    call_to_action: str
+
+
+class DesignOut(BaseModel):
+    """Visual design suggestions."""
+    color_palette: Dict[str, str]
+    image_ideas: List[str]
+    layout: str
+    typography: str
+    suggestions: List[str]
+
+
+class ReviewOut(BaseModel):
+    """Review verdict for campaign copy."""
+    score: int
+    feedback: str
+    approved: bool
+    suggestions: List[str]
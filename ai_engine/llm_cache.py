@@ -0,0 +1,151 @@
+"""
+Exact-match response cache for chat model calls.
+
+Every agent prompt is a fixed template filled with a small set of repeating
+campaign inputs, so identical calls are common. Responses are keyed by a
+SHA-256 of the model, rendered messages, temperature and call kwargs and
+served from a pluggable backend (in-process memory, or Redis when configured).
+"""
+
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from typing import Any, List, Optional, Protocol
+
+import orjson
+from langchain_core.load import dumpd
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.runnables import RunnableConfig
+from langchain_openai import ChatOpenAI
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Async key/value storage for serialized responses."""
+
+    async def aget(self, key: str) -> Optional[str]:
+        ...
+
+    async def aset(self, key: str, value: str) -> None:
+        ...
+
+
+class InMemoryCacheBackend:
+    """Process-local LRU cache backend."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, str]" = OrderedDict()
+
+    async def aget(self, key: str) -> Optional[str]:
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    async def aset(self, key: str, value: str) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+class RedisCacheBackend:
+    """Redis cache backend, shared across workers. Requires the `redis` package."""
+
+    def __init__(self, url: str, ttl: Optional[int] = 86_400, prefix: str = "llm_cache:"):
+        import redis.asyncio as redis
+
+        self._client = redis.from_url(url, decode_responses=True)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def aget(self, key: str) -> Optional[str]:
+        return await self._client.get(self.prefix + key)
+
+    async def aset(self, key: str, value: str) -> None:
+        await self._client.set(self.prefix + key, value, ex=self.ttl)
+
+
+_default_backend: Optional[CacheBackend] = None
+
+
+def default_cache_backend() -> CacheBackend:
+    """
+    Return the process-wide cache backend.
+    Uses Redis when LLM_CACHE_REDIS_URL is set, otherwise an in-memory LRU.
+    """
+    global _default_backend
+    if _default_backend is None:
+        redis_url = os.getenv("LLM_CACHE_REDIS_URL", "")
+        _default_backend = RedisCacheBackend(redis_url) if redis_url else InMemoryCacheBackend()
+    return _default_backend
+
+
+class CachedChatOpenAI(ChatOpenAI):
+    """ChatOpenAI that serves repeated identical calls from a CacheBackend."""
+
+    response_cache: Any = None
+
+    @classmethod
+    def from_chat_model(
+        cls,
+        llm: ChatOpenAI,
+        response_cache: Optional[CacheBackend] = None
+    ) -> "CachedChatOpenAI":
+        """Wrap an existing ChatOpenAI, reusing its configuration and clients."""
+        if isinstance(llm, cls):
+            return llm
+        fields = {name: getattr(llm, name) for name in llm.__fields__}
+        fields["response_cache"] = response_cache or default_cache_backend()
+        return cls(**fields)
+
+    def _cache_key(self, messages: List[BaseMessage], stop: Optional[List[str]], kwargs: dict) -> str:
+        payload = {
+            "model": self.model_name,
+            "messages": [dumpd(m) for m in messages],
+            "temperature": self.temperature,
+            "stop": stop,
+            "kwargs": kwargs
+        }
+        raw = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)
+        return hashlib.sha256(raw).hexdigest()
+
+    async def _aget_cached(self, key: str) -> Optional[BaseMessage]:
+        """Look up a cached response; backend errors count as a miss."""
+        cache = self.response_cache or default_cache_backend()
+        try:
+            cached = await cache.aget(key)
+            return messages_from_dict([orjson.loads(cached)])[0] if cached is not None else None
+        except Exception:
+            logger.warning("LLM cache read failed", exc_info=True)
+            return None
+
+    async def _aset_cached(self, key: str, message: BaseMessage) -> None:
+        """Store a response; backend errors are logged and otherwise ignored."""
+        cache = self.response_cache or default_cache_backend()
+        try:
+            await cache.aset(key, orjson.dumps(message_to_dict(message), default=str).decode())
+        except Exception:
+            logger.warning("LLM cache write failed", exc_info=True)
+
+    async def ainvoke(
+        self,
+        input: Any,
+        config: Optional[RunnableConfig] = None,
+        *,
+        stop: Optional[List[str]] = None,
+        **kwargs: Any
+    ) -> BaseMessage:
+        messages = self._convert_input(input).to_messages()
+        key = self._cache_key(messages, stop, kwargs)
+
+        cached = await self._aget_cached(key)
+        if cached is not None:
+            return cached
+
+        response = await super().ainvoke(input, config, stop=stop, **kwargs)
+        await self._aset_cached(key, response)
+        return response
@@ -1,16 +1,61 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+import hashlib
+import logging
 import random
+import re
+from cachetools import TTLCache
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 
+from ..llm_cache import CacheBackend, CachedChatOpenAI
+
+logger = logging.getLogger(__name__)
+
+VARIANT_PROMPT = ChatPromptTemplate.from_template(
+    "You are an expert copywriter. Take the following marketing copy and rewrite it to have a completely different tone (e.g., if it's professional, make it punchy and casual).\n\n"
+    "This is rewrite #{seed}; take a different angle from other rewrites of the same copy.\n\nOriginal Copy:\n{copy}"
+)
+
+JUDGE_PROMPT = ChatPromptTemplate.from_template(
+    "You are a simulated target audience for a tech product. Read these variations of marketing copy and determine which one would result in the highest click-through rate (CTR).\n\n"
+    "{variants}\n\n"
+    "Respond with exactly one of {labels} followed by a newline, and then your rationale."
+)
+
+
+def _variant_label(index: int) -> str:
+    """Label of the index-th candidate: Variant A is the original copy."""
+    return f"Variant {chr(ord('A') + index)}"
+
+
+def _judge_key(candidates: List[str]) -> str:
+    """Cache key for a judgment: the candidates, whitespace-trimmed, in prompt order."""
+    return hashlib.sha256("\x00".join(copy.strip() for copy in candidates).encode()).hexdigest()
+
+
+def _swap_labels(text: str) -> str:
+    """Swap Variant A and Variant B in a two-candidate rationale."""
+    return re.sub(r"Variant ([AB])\b", lambda m: "Variant B" if m.group(1) == "A" else "Variant A", text)
+
+
 class ABSimulatorNode:
     """
     A/B Testing Simulator Node for LangGraph.
     Generates variations of copy, runs them against a 'Simulated Audience Agent'
     to predict engagement, and selects the winner to proceed.
+    
+    All variants are generated concurrently and judged in a single call, so a
+    test costs two LLM round trips regardless of num_variants. Judgments are
+    cached for a day, keyed by the candidate copy.
     """
-    def __init__(self, llm: ChatOpenAI):
-        self.llm = llm
+    def __init__(self, llm: ChatOpenAI, cache: Optional[CacheBackend] = None, num_variants: int = 1):
+        if not 1 <= num_variants <= 25:
+            raise ValueError("num_variants must be between 1 and 25")
+        self.llm = CachedChatOpenAI.from_chat_model(llm, cache)
+        self.num_variants = num_variants
+        self._variant_chain = VARIANT_PROMPT | self.llm
+        self._judge_chain = JUDGE_PROMPT | self.llm
+        self._judge_cache: TTLCache = TTLCache(maxsize=10_000, ttl=86_400)
 
     async def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -20,42 +65,50 @@ class ABSimulatorNode:
         if not original_copy:
             return {"ab_test_winner": "", "ab_test_logs": "No copy to test."}
             
-        print("[A/B Simulator] Generating Alternative Copy (Variant B)...")
-        variant_b = await self._generate_variant(original_copy)
+        logger.debug("A/B Simulator: generating %d alternative copy variant(s)", self.num_variants)
+        candidates = [original_copy] + await self._generate_variants(original_copy)
         
-        print(f"[A/B Simulator] Running simulated audience test between Variant A (original) and Variant B...")
-        winner, rationale = await self._simulate_audience_test(original_copy, variant_b)
+        logger.debug("A/B Simulator: running simulated audience test between Variant A (original) and %d variant(s)", len(candidates) - 1)
+        winner, rationale = await self._simulate_audience_test(candidates)
         
-        print(f"[A/B Simulator] Winner selected: {winner}")
+        logger.info("A/B Simulator: winner selected: %s", winner)
         
         return {
-            "draft_content": original_copy if winner == "Variant A" else variant_b,
+            "draft_content": candidates[ord(winner[-1]) - ord("A")],
             "ab_test_logs": rationale,
             "ab_test_winner": winner
         }
 
-    async def _generate_variant(self, original_copy: str) -> str:
-        prompt = ChatPromptTemplate.from_template(
-            "You are an expert copywriter. Take the following marketing copy and rewrite it to have a completely different tone (e.g., if it's professional, make it punchy and casual).\n\nOriginal Copy:\n{copy}"
+    async def _generate_variants(self, original_copy: str) -> List[str]:
+        responses = await self._variant_chain.abatch(
+            [{"copy": original_copy, "seed": i + 1} for i in range(self.num_variants)]
         )
-        chain = prompt | self.llm
-        response = await chain.ainvoke({"copy": original_copy})
-        return response.content
-
-    async def _simulate_audience_test(self, copy_a: str, copy_b: str) -> tuple[str, str]:
-        prompt = ChatPromptTemplate.from_template(
-            "You are a simulated target audience for a tech product. Read these two variations of marketing copy and determine which one would result in a higher click-through rate (CTR).\n\n"
-            "Variant A:\n{copy_a}\n\n"
-            "Variant B:\n{copy_b}\n\n"
-            "Respond with exactly 'Variant A' or 'Variant B' followed by a newline, and then your rationale."
-        )
-        chain = prompt | self.llm
+        return [response.content for response in responses]
+
+    async def _simulate_audience_test(self, candidates: List[str]) -> tuple[str, str]:
+        labels = [_variant_label(i) for i in range(len(candidates))]
+        key = _judge_key(candidates)
+        cached = self._judge_cache.get(key)
+        if cached is not None:
+            return cached
         try:
-            response = await chain.ainvoke({"copy_a": copy_a, "copy_b": copy_b})
+            response = await self._judge_chain.ainvoke({
+                "variants": "\n\n".join(f"{label}:\n{copy}" for label, copy in zip(labels, candidates)),
+                "labels": ", ".join(f"'{label}'" for label in labels)
+            })
             text = response.content.strip()
-            winner = "Variant B" if "Variant B" in text.split("\n")[0] else "Variant A"
-            return winner, text
+            match = re.search(r"Variant ([A-Z])\b", text.split("\n")[0])
+            winner = f"Variant {match.group(1)}" if match else labels[0]
+            if winner not in labels:
+                winner = labels[0]
         except Exception:
-            # Fallback
-            winner = random.choice(["Variant A", "Variant B"])
+            # Fallback; not cached so the next run retries the judge
+            winner = random.choice(labels)
             return winner, f"API Error. Randomly selected {winner}"
+
+        self._judge_cache[key] = (winner, text)
+        if len(candidates) == 2:
+            # A vs B is symmetric, so the swapped pair has the inverted winner
+            swapped = labels[1] if winner == labels[0] else labels[0]
+            self._judge_cache[_judge_key(candidates[::-1])] = (swapped, _swap_labels(text))
+        return winner, text
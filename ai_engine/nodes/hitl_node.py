@@ -1,4 +1,7 @@
 from typing import Dict, Any
+import logging
+
+logger = logging.getLogger(__name__)
 
 class HumanInTheLoopNode:
     """
@@ -13,7 +16,7 @@ class HumanInTheLoopNode:
         The FastAPI backend will expose an interactive dashboard endpoint 
         allowing the creative director to swipe left or right on this state.
         """
-        print("[Human-in-the-Loop] Execution paused. Awaiting human approval.")
+        logger.info("Human-in-the-Loop: execution paused for campaign %s, awaiting human approval", state.get("campaign_id", "unknown"))
         
         # We mutate the state to reflect that it is pending review.
         # In a real LangGraph setup with checkpointers, this node would literally
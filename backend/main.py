@@ -1,11 +1,28 @@
+import logging
+import logging.handlers
+import queue
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from .routers import campaigns
 
+# Handlers run on a listener thread; the event loop only enqueues records
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+# QueueHandler.prepare() bakes its formatter into the record, so it must only pass the
+# message through; the listener's handler applies the real format
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+
 app = FastAPI(
     title="AI Agency API",
     description="Multi-agent AI content generation pipeline",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -19,6 +36,21 @@ app.add_middleware(
 app.include_router(campaigns.router, prefix="/api/v1", tags=["campaigns"])
 
 
+@app.on_event("startup")
+def start_logging():
+    _log_listener.start()
+
+
+@app.on_event("shutdown")
+async def close_http_client():
+    await campaigns.http_client.aclose()
+
+
+@app.on_event("shutdown")
+def stop_logging():
+    _log_listener.stop()
+
+
 @app.get("/")
 def root():
     return {
@@ -1,18 +1,33 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 from datetime import datetime
+import asyncio
+import httpx
+import orjson
 import uuid
 
 from ...ai_engine.graph.campaign_workflow import CampaignWorkflow
+from ..store import GetOp, PutOp, create_store
 
 router = APIRouter()
 
+# Shared connection pool for every OpenAI call, closed on app shutdown
+http_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    timeout=30.0,
+    http2=True
+)
+
 # Initialize workflow
-workflow = CampaignWorkflow()
+workflow = CampaignWorkflow(http_client=http_client)
+
+# Campaign storage (Redis when REDIS_URL is set, in-memory otherwise)
+store = create_store()
 
-# In-memory storage
-campaigns_db = {}
+# Bounds background pipeline runs independently of HTTP request concurrency
+_worker_slots = asyncio.Semaphore(workflow.max_concurrency)
 
 
 class CampaignCreate(BaseModel):
@@ -23,6 +38,10 @@ class CampaignCreate(BaseModel):
     content_type: str = "blog_post"  # blog_post, social_media, email, ad
 
 
+class CampaignBatchExecute(BaseModel):
+    campaign_ids: List[str] = Field(..., min_length=1)
+
+
 class CampaignStage(BaseModel):
     agent: str
     status: str  # pending, in_progress, completed, failed
@@ -39,19 +58,24 @@ class CampaignResponse(BaseModel):
     target_audience: str
     tone: str
     content_type: str
-    status: str  # pending, running, completed, failed
+    status: str  # pending, queued, running, completed, failed, cancelled
     stages: List[CampaignStage]
     final_content: Optional[dict] = None
     created_at: datetime
     updated_at: datetime
 
+    @field_serializer("final_content")
+    def serialize_final_content(self, final_content: Optional[dict]) -> Optional[dict]:
+        """generated_at is stored as an epoch timestamp and only formatted on output."""
+        return _format_final_content(final_content)
+
 
 @router.post("/campaigns", response_model=CampaignResponse)
 async def create_campaign(campaign: CampaignCreate):
     """Create a new content generation campaign."""
-    campaign_id = str(uuid.uuid4())
-    
+    campaign_id = uuid.uuid4().hex
     now = datetime.now()
+    
     db_campaign = {
         "id": campaign_id,
         "name": campaign.name,
@@ -71,73 +95,241 @@ async def create_campaign(campaign: CampaignCreate):
         "updated_at": now
     }
     
-    campaigns_db[campaign_id] = db_campaign
+    await store.aput(db_campaign)
     
     return CampaignResponse(**db_campaign)
 
 
 @router.get("/campaigns", response_model=List[CampaignResponse])
-async def list_campaigns():
-    """List all campaigns."""
-    return [CampaignResponse(**c) for c in campaigns_db.values()]
+async def list_campaigns(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0)
+):
+    """List campaigns in creation order."""
+    campaigns = await store.asearch(limit=limit, offset=offset)
+    return ORJSONResponse([_response_payload(c) for c in campaigns])
 
 
 @router.get("/campaigns/{campaign_id}", response_model=CampaignResponse)
 async def get_campaign(campaign_id: str):
     """Get a specific campaign."""
-    if campaign_id not in campaigns_db:
+    campaign = await store.aget(campaign_id)
+    if campaign is None:
         raise HTTPException(status_code=404, detail="Campaign not found")
-    return CampaignResponse(**campaigns_db[campaign_id])
+    return ORJSONResponse(_response_payload(campaign))
 
 
-@router.post("/campaigns/{campaign_id}/execute")
-async def execute_campaign(campaign_id: str):
+@router.post("/campaigns/{campaign_id}/execute", status_code=status.HTTP_202_ACCEPTED)
+async def execute_campaign(campaign_id: str, request: Request, background_tasks: BackgroundTasks):
     """
-    Execute the full content generation pipeline.
-    Runs: Researcher -> Copywriter -> Designer -> Reviewer
+    Queue the full content generation pipeline and return immediately.
+    Runs: Researcher -> (Copywriter || Designer) -> Reviewer
+    Poll the returned URL for progress, or use /execute/stream to follow it live.
     """
-    if campaign_id not in campaigns_db:
+    campaign = await store.aget(campaign_id)
+    if campaign is None:
         raise HTTPException(status_code=404, detail="Campaign not found")
     
-    campaign = campaigns_db[campaign_id]
-    campaign["status"] = "running"
+    campaign["status"] = "queued"
     campaign["updated_at"] = datetime.now()
+    await store.aput(campaign)
+    
+    background_tasks.add_task(_run_campaign, campaign)
     
-    try:
-        # Run the workflow
-        result = await workflow.execute(
-            topic=campaign["topic"],
-            target_audience=campaign["target_audience"],
-            tone=campaign["tone"],
-            content_type=campaign["content_type"]
-        )
+    return {
+        "id": campaign_id,
+        "status": "queued",
+        "poll_url": request.app.url_path_for("get_campaign", campaign_id=campaign_id)
+    }
+
+
+async def _run_campaign(campaign: dict) -> None:
+    """Background worker: run the workflow for a queued campaign and persist the result."""
+    async with _worker_slots:
+        campaign["status"] = "running"
+        campaign["updated_at"] = datetime.now()
+        if not await _save_if_present(campaign):
+            return
         
-        # Update stages with results
-        for i, stage in enumerate(campaign["stages"]):
-            if result.get(stage["agent"]):
-                stage["status"] = "completed"
-                stage["output"] = result[stage["agent"]]
-                stage["completed_at"] = datetime.now()
+        try:
+            # Run the workflow
+            result = await workflow.execute(
+                topic=campaign["topic"],
+                target_audience=campaign["target_audience"],
+                tone=campaign["tone"],
+                content_type=campaign["content_type"]
+            )
+            _apply_result(campaign, result, datetime.now())
+            
+        except Exception as e:
+            _apply_result(campaign, e, datetime.now())
         
-        campaign["final_content"] = result.get("final_content")
-        campaign["status"] = "completed"
+        await _save_if_present(campaign)
+
+
+async def _run_campaigns(campaigns: List[dict]) -> None:
+    """Background worker: run several queued campaigns concurrently."""
+    await asyncio.gather(*(_run_campaign(c) for c in campaigns))
+
+
+async def _save_if_present(campaign: dict) -> bool:
+    """Write back a campaign unless it was deleted while its pipeline was queued or running."""
+    return await store.aput(campaign, if_exists=True)
+
+
+@router.get("/campaigns/{campaign_id}/execute/stream")
+async def execute_campaign_stream(campaign_id: str):
+    """
+    Execute the pipeline, streaming generated text as Server-Sent Events.
+    Each event is `data: {"stage": ..., "text": ...}`, where text is the next
+    plain-text piece of the copywriter's body or the reviewer's feedback (not
+    raw JSON); concatenating a stage's events gives the full field. A final status event is
+    followed by `data: [DONE]`. Full outputs are persisted as in /execute.
+    """
+    campaign = await store.aget(campaign_id)
+    if campaign is None:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    
+    campaign["status"] = "queued"
+    campaign["updated_at"] = datetime.now()
+    await store.aput(campaign)
+    
+    async def event_gen():
+        try:
+            # Streaming runs share the worker slots, so they count towards WORKFLOW_MAX_CONCURRENCY
+            async with _worker_slots:
+                campaign["status"] = "running"
+                campaign["updated_at"] = datetime.now()
+                if not await _save_if_present(campaign):
+                    return
+                
+                try:
+                    async for stage, chunk in workflow.aexecute_stream(
+                        topic=campaign["topic"],
+                        target_audience=campaign["target_audience"],
+                        tone=campaign["tone"],
+                        content_type=campaign["content_type"]
+                    ):
+                        if stage == "result":
+                            _apply_result(campaign, chunk, datetime.now())
+                        else:
+                            yield f"data: {orjson.dumps({'stage': stage, 'text': chunk}).decode()}\n\n"
+                except Exception as e:
+                    _apply_result(campaign, e, datetime.now())
+        finally:
+            # Runs on client disconnect too (GeneratorExit/CancelledError), so the
+            # campaign is never left queued or running
+            if campaign["status"] in ("queued", "running"):
+                campaign["status"] = "cancelled"
+                campaign["error"] = "Stream closed before the pipeline finished"
+                campaign["updated_at"] = datetime.now()
+            await _save_if_present(campaign)
         
-    except Exception as e:
+        yield f"data: {orjson.dumps({'stage': 'status', 'status': campaign['status']}).decode()}\n\n"
+        yield "data: [DONE]\n\n"
+    
+    return StreamingResponse(
+        event_gen(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/campaigns/batch-execute", status_code=status.HTTP_202_ACCEPTED)
+async def batch_execute_campaigns(
+    batch: CampaignBatchExecute,
+    request: Request,
+    background_tasks: BackgroundTasks
+):
+    """
+    Queue the pipeline for several campaigns at once and return immediately.
+    Campaigns run in the background, sharing the WORKFLOW_MAX_CONCURRENCY
+    worker slots with single executions.
+    """
+    campaign_ids = list(dict.fromkeys(batch.campaign_ids))
+    campaigns = await store.abatch([GetOp(cid) for cid in campaign_ids])
+    missing = [cid for cid, c in zip(campaign_ids, campaigns) if c is None]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Campaigns not found: {', '.join(missing)}")
+    
+    now = datetime.now()
+    for campaign in campaigns:
+        campaign["status"] = "queued"
+        campaign["updated_at"] = now
+    await store.abatch([PutOp(c) for c in campaigns])
+    
+    # BackgroundTasks runs its tasks one after another, so schedule a single
+    # task that runs the batch concurrently; _worker_slots still bounds it
+    background_tasks.add_task(_run_campaigns, campaigns)
+    
+    return [
+        {
+            "id": campaign["id"],
+            "status": "queued",
+            "poll_url": request.app.url_path_for("get_campaign", campaign_id=campaign["id"])
+        }
+        for campaign in campaigns
+    ]
+
+
+# Stage agent name -> key of its output in a workflow result
+_STAGE_RESULT_KEYS = {
+    "researcher": "research",
+    "copywriter": "copy",
+    "designer": "design",
+    "reviewer": "review"
+}
+
+
+def _apply_result(campaign: dict, result, now: datetime) -> None:
+    """Persist a workflow result (or the exception it raised) onto a stored campaign."""
+    campaign["updated_at"] = now
+    if isinstance(result, Exception):
         campaign["status"] = "failed"
-        campaign["error"] = str(e)
+        campaign["error"] = str(result)
+        return
     
-    campaign["updated_at"] = datetime.now()
+    # Update stages with results
+    for stage in campaign["stages"]:
+        output = result.get(_STAGE_RESULT_KEYS[stage["agent"]])
+        if output:
+            stage["status"] = "completed"
+            stage["output"] = output
+            stage["completed_at"] = now
     
-    return CampaignResponse(**campaign)
+    campaign["final_content"] = result.get("final_content")
+    campaign["status"] = "completed"
+
+
+_STAGE_DEFAULTS = {name: None for name in CampaignStage.model_fields}
+
+
+def _response_payload(campaign: dict) -> dict:
+    """
+    Shape a stored campaign like CampaignResponse without validating it.
+    Stored campaigns are only written by this module, so the read path
+    returns them directly instead of re-validating every field per request.
+    """
+    payload = {name: campaign.get(name) for name in CampaignResponse.model_fields}
+    payload["stages"] = [{**_STAGE_DEFAULTS, **stage} for stage in campaign["stages"]]
+    payload["final_content"] = _format_final_content(payload["final_content"])
+    return payload
+
+
+def _format_final_content(final_content: Optional[dict]) -> Optional[dict]:
+    if final_content and isinstance(final_content.get("generated_at"), float):
+        generated_at = datetime.fromtimestamp(final_content["generated_at"])
+        return {**final_content, "generated_at": generated_at.isoformat()}
+    return final_content
 
 
 @router.get("/campaigns/{campaign_id}/stages/{stage}")
 async def get_stage_output(campaign_id: str, stage: str):
     """Get output from a specific stage."""
-    if campaign_id not in campaigns_db:
+    campaign = await store.aget(campaign_id)
+    if campaign is None:
         raise HTTPException(status_code=404, detail="Campaign not found")
     
-    campaign = campaigns_db[campaign_id]
     stage_data = next((s for s in campaign["stages"] if s["agent"] == stage), None)
     
     if not stage_data:
@@ -149,8 +341,7 @@ async def get_stage_output(campaign_id: str, stage: str):
 @router.delete("/campaigns/{campaign_id}")
 async def delete_campaign(campaign_id: str):
     """Delete a campaign."""
-    if campaign_id not in campaigns_db:
+    if not await store.adelete(campaign_id):
         raise HTTPException(status_code=404, detail="Campaign not found")
     
-    del campaigns_db[campaign_id]
     return {"message": "Campaign deleted"}
@@ -0,0 +1,171 @@
+"""
+Campaign storage.
+
+Stores expose batched operations (GetOp, PutOp, DeleteOp, SearchOp) through
+`abatch`, with `aget`/`aput`/`adelete`/`asearch` as single-op shortcuts.
+The Redis store executes a whole batch in one pipelined round trip and keeps
+a sorted-set index by creation time for paginated listing.
+"""
+
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Union
+
+import orjson
+
+
+class GetOp(NamedTuple):
+    campaign_id: str
+
+
+class PutOp(NamedTuple):
+    campaign: Dict[str, Any]
+    # Only overwrite an existing campaign, never recreate a deleted one
+    if_exists: bool = False
+
+
+class DeleteOp(NamedTuple):
+    campaign_id: str
+
+
+class SearchOp(NamedTuple):
+    limit: int = 100
+    offset: int = 0
+
+
+Op = Union[GetOp, PutOp, DeleteOp, SearchOp]
+
+
+class CampaignStore(ABC):
+    """Async campaign store with batched operations."""
+
+    @abstractmethod
+    async def abatch(self, ops: Sequence[Op]) -> List[Any]:
+        """
+        Execute operations in order.
+        Returns one result per op: the campaign (or None) for GetOp, whether
+        the campaign was written for PutOp, whether a campaign was deleted for
+        DeleteOp, and a list of campaigns ordered by creation time for SearchOp.
+        """
+
+    async def aget(self, campaign_id: str) -> Optional[Dict[str, Any]]:
+        return (await self.abatch([GetOp(campaign_id)]))[0]
+
+    async def aput(self, campaign: Dict[str, Any], if_exists: bool = False) -> bool:
+        return (await self.abatch([PutOp(campaign, if_exists)]))[0]
+
+    async def adelete(self, campaign_id: str) -> bool:
+        return (await self.abatch([DeleteOp(campaign_id)]))[0]
+
+    async def asearch(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        return (await self.abatch([SearchOp(limit, offset)]))[0]
+
+
+class InMemoryCampaignStore(CampaignStore):
+    """Single-process store for local development."""
+
+    def __init__(self):
+        self._campaigns: Dict[str, Dict[str, Any]] = {}
+
+    async def abatch(self, ops: Sequence[Op]) -> List[Any]:
+        results = []
+        for op in ops:
+            if isinstance(op, GetOp):
+                results.append(self._campaigns.get(op.campaign_id))
+            elif isinstance(op, PutOp):
+                if op.if_exists and op.campaign["id"] not in self._campaigns:
+                    results.append(False)
+                    continue
+                self._campaigns[op.campaign["id"]] = op.campaign
+                results.append(True)
+            elif isinstance(op, DeleteOp):
+                results.append(self._campaigns.pop(op.campaign_id, None) is not None)
+            else:
+                # Dicts keep insertion order, which is creation order
+                campaigns = list(self._campaigns.values())
+                results.append(campaigns[op.offset:op.offset + op.limit])
+        return results
+
+
+class RedisCampaignStore(CampaignStore):
+    """Redis-backed store shared across workers. Requires the `redis` package."""
+
+    def __init__(self, url: str, namespace: str = "campaigns"):
+        import redis.asyncio as redis
+
+        self._client = redis.from_url(url, decode_responses=True)
+        self.namespace = namespace
+        self._index = f"{namespace}:index"
+
+    def _key(self, campaign_id: str) -> str:
+        return f"{self.namespace}:{campaign_id}"
+
+    async def abatch(self, ops: Sequence[Op]) -> List[Any]:
+        pipe = self._client.pipeline(transaction=False)
+        for op in ops:
+            if isinstance(op, GetOp):
+                pipe.get(self._key(op.campaign_id))
+            elif isinstance(op, PutOp):
+                # With if_exists, SET XX and ZADD XX only touch a campaign that still exists,
+                # so a concurrent delete can't be undone by this write
+                pipe.set(self._key(op.campaign["id"]), _dumps(op.campaign), xx=op.if_exists)
+                pipe.zadd(
+                    self._index,
+                    {op.campaign["id"]: _timestamp(op.campaign["created_at"])},
+                    xx=op.if_exists
+                )
+            elif isinstance(op, DeleteOp):
+                pipe.delete(self._key(op.campaign_id))
+                pipe.zrem(self._index, op.campaign_id)
+            else:
+                pipe.zrange(self._index, op.offset, op.offset + op.limit - 1)
+        replies = iter(await pipe.execute())
+
+        results: List[Any] = []
+        searches = []
+        for op in ops:
+            if isinstance(op, GetOp):
+                raw = next(replies)
+                results.append(_loads(raw) if raw else None)
+            elif isinstance(op, PutOp):
+                written, _ = next(replies), next(replies)
+                results.append(bool(written))
+            elif isinstance(op, DeleteOp):
+                deleted, _ = next(replies), next(replies)
+                results.append(bool(deleted))
+            else:
+                ids = next(replies)
+                if ids:
+                    searches.append((len(results), ids))
+                results.append([])
+
+        # Listing needs the ids from the index first, so fetch all pages in one more round trip
+        if searches:
+            pipe = self._client.pipeline(transaction=False)
+            for _, ids in searches:
+                pipe.mget([self._key(cid) for cid in ids])
+            for (i, _), raws in zip(searches, await pipe.execute()):
+                results[i] = [_loads(raw) for raw in raws if raw]
+        return results
+
+
+def create_store() -> CampaignStore:
+    """Use Redis when REDIS_URL is set, otherwise fall back to in-process memory."""
+    redis_url = os.getenv("REDIS_URL", "")
+    return RedisCampaignStore(redis_url) if redis_url else InMemoryCampaignStore()
+
+
+def _timestamp(value: Union[datetime, str]) -> float:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.timestamp()
+
+
+def _dumps(campaign: Dict[str, Any]) -> str:
+    # orjson serializes datetimes natively as ISO 8601
+    return orjson.dumps(campaign, default=str).decode()
+
+
+def _loads(raw: str) -> Dict[str, Any]:
+    return orjson.loads(raw)